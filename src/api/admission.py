@@ -0,0 +1,132 @@
+import asyncio
+import math
+import time
+from typing import Dict, Optional, Tuple
+
+from fastapi import Depends, HTTPException, status
+
+from ..config import settings
+from ..auth.security import TokenData, get_current_user
+
+COST_LIGHT = "light"
+COST_HEAVY = "heavy"
+
+BUCKET_PRUNE_INTERVAL_SECONDS = 60
+
+class TokenBucket:
+    def __init__(self, rate_per_second: float, capacity: float):
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def take(self) -> Optional[float]:
+        """Takes one token. Returns None when allowed, else the seconds until a token is available."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate_per_second)
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return None
+        return (1 - self.tokens) / self.rate_per_second
+
+    def is_full(self, now: float) -> bool:
+        """True when the bucket has refilled to capacity, i.e. dropping it loses no state."""
+        return self.tokens + (now - self.updated_at) * self.rate_per_second >= self.capacity
+
+    def refund(self) -> None:
+        """Gives back a token taken for a request that was rejected before doing any work."""
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+class AdmissionController:
+    """
+    Per-worker admission control: caps concurrent heavy requests with a bounded wait queue and
+    applies token-bucket quotas per authenticated user and cost class.
+    """
+
+    def __init__(self,
+                 heavy_max_concurrency: int = settings.ADMISSION_HEAVY_MAX_CONCURRENCY,
+                 heavy_max_queue: int = settings.ADMISSION_HEAVY_MAX_QUEUE,
+                 heavy_queue_timeout_seconds: float = settings.ADMISSION_HEAVY_QUEUE_TIMEOUT_SECONDS):
+        self.heavy_max_queue = heavy_max_queue
+        self.heavy_queue_timeout_seconds = heavy_queue_timeout_seconds
+        self._heavy_slots = asyncio.Semaphore(heavy_max_concurrency)
+        self._heavy_waiting = 0
+        self._quotas: Dict[str, Tuple[float, float]] = {
+            COST_LIGHT: (settings.QUOTA_LIGHT_PER_MINUTE / 60, settings.QUOTA_LIGHT_BURST),
+            COST_HEAVY: (settings.QUOTA_HEAVY_PER_MINUTE / 60, settings.QUOTA_HEAVY_BURST),
+        }
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._last_prune = time.monotonic()
+
+    def check_quota(self, username: str, cost: str) -> Optional[float]:
+        rate_per_second, capacity = self._quotas[cost]
+        if rate_per_second <= 0:
+            return None
+        self._prune_idle_buckets()
+        bucket = self._buckets.get((username, cost))
+        if bucket is None:
+            bucket = self._buckets[(username, cost)] = TokenBucket(rate_per_second, capacity)
+        return bucket.take()
+
+    def _prune_idle_buckets(self) -> None:
+        # A full bucket behaves exactly like a new one, so idle users' buckets can be dropped.
+        now = time.monotonic()
+        if now - self._last_prune < BUCKET_PRUNE_INTERVAL_SECONDS:
+            return
+        self._last_prune = now
+        for key in [key for key, bucket in self._buckets.items() if bucket.is_full(now)]:
+            del self._buckets[key]
+
+    def refund_quota(self, username: str, cost: str) -> None:
+        bucket = self._buckets.get((username, cost))
+        if bucket is not None:
+            bucket.refund()
+
+    async def acquire_heavy(self) -> bool:
+        """Waits for a heavy slot. Returns False when the wait queue is full or the wait times out."""
+        if self._heavy_slots.locked() and self._heavy_waiting >= self.heavy_max_queue:
+            return False
+        self._heavy_waiting += 1
+        try:
+            await asyncio.wait_for(self._heavy_slots.acquire(), self.heavy_queue_timeout_seconds)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._heavy_waiting -= 1
+
+    def release_heavy(self) -> None:
+        self._heavy_slots.release()
+
+admission_controller = AdmissionController()
+
+def _too_many_requests(detail: str, retry_after: float) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=detail,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+def _enforce_quota(token_data: TokenData, cost: str) -> None:
+    retry_after = admission_controller.check_quota(token_data.username, cost)
+    if retry_after is not None:
+        raise _too_many_requests(f"Cota de requisições excedida para o usuário '{token_data.username}'.", retry_after)
+
+async def admit_light(token_data: TokenData = Depends(get_current_user)):
+    _enforce_quota(token_data, COST_LIGHT)
+    return token_data
+
+async def admit_heavy(token_data: TokenData = Depends(get_current_user)):
+    _enforce_quota(token_data, COST_HEAVY)
+    if not await admission_controller.acquire_heavy():
+        # Rejected for saturation, not for the user's own usage: the quota token is not spent.
+        admission_controller.refund_quota(token_data.username, COST_HEAVY)
+        raise _too_many_requests(
+            "Servidor ocupado com requisições pesadas. Tente novamente mais tarde.",
+            admission_controller.heavy_queue_timeout_seconds
+        )
+    try:
+        yield token_data
+    finally:
+        admission_controller.release_heavy()
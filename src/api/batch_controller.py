@@ -0,0 +1,153 @@
+from fastapi import APIRouter, HTTPException, Depends
+from asyncio import gather
+from typing import List, Dict, Any, Optional, Tuple
+
+from ..config import settings
+from ..scraper.core import (
+    fetch_year_table,
+    get_year_range,
+    get_available_suboptions,
+    DeadlineExceeded
+)
+from ..scraper.registry import SECTION_REGISTRY
+from ..auth.security import ensure_authenticated
+from .admission import admit_heavy
+from .schemas import BatchRequest, BatchResponse, BatchQuery
+
+router = APIRouter(
+    prefix="/batch",
+    tags=["Batch"],
+    dependencies=[Depends(ensure_authenticated)]
+)
+
+def _fail(result: Dict[str, Any], status_code: int, detail: str) -> None:
+    result["status_code"] = status_code
+    result["error"] = detail
+
+def _years_for_query(query: BatchQuery, min_year: int, max_year: int) -> Tuple[List[int], Optional[str]]:
+    """Expands the year selection of a query into the list of years to fetch, or returns an error message."""
+    if query.all_years:
+        return list(range(min_year, max_year + 1)), None
+    if query.year is not None:
+        if not (min_year <= query.year <= max_year):
+            return [], f"Ano {query.year} fora do intervalo. Intervalo disponível: [{min_year}-{max_year}]"
+        return [query.year], None
+    if query.year_start is not None or query.year_end is not None:
+        start = max(query.year_start if query.year_start is not None else min_year, min_year)
+        end = min(query.year_end if query.year_end is not None else max_year, max_year)
+        if start > end:
+            return [], f"Intervalo de anos sem dados disponíveis. Intervalo disponível: [{min_year}-{max_year}]"
+        return list(range(start, end + 1)), None
+    return [max_year], None
+
+@router.post("",
+             dependencies=[Depends(admit_heavy)],
+             summary="Executa várias consultas de seção/subopção/ano em uma única chamada",
+             description="Recebe uma lista de consultas (seção, subopção opcional e ano, intervalo de anos, todos os anos ou, por padrão, o último ano). "
+                         "As consultas são planejadas em conjunto: subopções, intervalos de anos e páginas compartilhadas são buscados uma única vez "
+                         "e executados em paralelo respeitando o limite de concorrência do scraper. Cada resultado traz seus próprios dados ou erro.",
+             response_model=BatchResponse)
+async def run_batch_route(request: BatchRequest):
+    if not request.queries:
+        raise HTTPException(status_code=400, detail="A lista de consultas não pode ser vazia.")
+    if len(request.queries) > settings.BATCH_MAX_QUERIES:
+        raise HTTPException(status_code=400, detail=f"Máximo de {settings.BATCH_MAX_QUERIES} consultas por chamada.")
+
+    results: List[Dict[str, Any]] = [
+        {"index": i, "query": query, "years": [], "data": [], "status_code": 200, "error": None}
+        for i, query in enumerate(request.queries)
+    ]
+
+    # 1. Section and suboption validation, with one suboption lookup per distinct section.
+    pending: List[Tuple[Dict[str, Any], str, Optional[str]]] = []
+    sections_needing_subs = set()
+    for result in results:
+        query: BatchQuery = result["query"]
+        spec = SECTION_REGISTRY.get(query.section)
+        if spec is None:
+            _fail(result, 404, f"Seção '{query.section}' não encontrada. Seções disponíveis: {', '.join(SECTION_REGISTRY)}")
+            continue
+        section_opcao = spec.opcao
+        if spec.has_suboptions:
+            if not query.subopcao:
+                _fail(result, 400, f"A seção '{query.section}' exige uma subopção.")
+                continue
+            sections_needing_subs.add(section_opcao)
+        elif query.subopcao:
+            _fail(result, 400, f"A seção '{query.section}' não possui subopções.")
+            continue
+        pending.append((result, section_opcao, query.subopcao))
+
+    section_list = sorted(sections_needing_subs)
+    sub_lists = await gather(*(get_available_suboptions(section_opcao=o) for o in section_list), return_exceptions=True)
+    suboption_names: Dict[str, Any] = dict(zip(section_list, sub_lists))
+
+    # 2. One year-range lookup per distinct (section, suboption).
+    validated: List[Tuple[Dict[str, Any], str, Optional[str], Optional[str]]] = []
+    for result, section_opcao, subopcao_value in pending:
+        suboption_name = None
+        if subopcao_value:
+            subs = suboption_names[section_opcao]
+            if isinstance(subs, Exception):
+                _fail(result, 504 if isinstance(subs, DeadlineExceeded) else 502,
+                      f"Falha ao listar subopções para {result['query'].section}: {subs}")
+                continue
+            suboption_name = next((sub["name"] for sub in subs if sub["value"] == subopcao_value), None)
+            if suboption_name is None:
+                _fail(result, 404, f"Subopção '{subopcao_value}' não encontrada para {result['query'].section}.")
+                continue
+        validated.append((result, section_opcao, subopcao_value, suboption_name))
+
+    range_keys = sorted({(o, sub) for _, o, sub, _ in validated}, key=str)
+    ranges = await gather(*(get_year_range(section_opcao=o, subopcao_value=sub) for o, sub in range_keys), return_exceptions=True)
+    year_ranges = dict(zip(range_keys, ranges))
+
+    # 3. One page fetch per distinct (section, suboption, year) across every query.
+    planned: List[Tuple[Dict[str, Any], str, Optional[str]]] = []
+    page_names: Dict[Tuple[str, Optional[str], int], Optional[str]] = {}
+    for result, section_opcao, subopcao_value, suboption_name in validated:
+        year_range = year_ranges[(section_opcao, subopcao_value)]
+        if isinstance(year_range, Exception):
+            _fail(result, 504 if isinstance(year_range, DeadlineExceeded) else 502,
+                  f"Falha ao determinar o intervalo de anos: {year_range}")
+            continue
+        min_year, max_year = year_range
+        if min_year is None or max_year is None:
+            _fail(result, 404, "Não foi possível determinar o intervalo de anos.")
+            continue
+        years, error = _years_for_query(result["query"], min_year, max_year)
+        if error:
+            _fail(result, 400, error)
+            continue
+        result["years"] = years
+        for year in years:
+            page_names[(section_opcao, subopcao_value, year)] = suboption_name
+        planned.append((result, section_opcao, subopcao_value))
+
+    page_keys = list(page_names)
+    pages = await gather(
+        *(fetch_year_table(o, year, sub, page_names[(o, sub, year)]) for o, sub, year in page_keys),
+        return_exceptions=True
+    )
+    page_data = dict(zip(page_keys, pages))
+
+    # 4. Per-query assembly; years that failed are reported without discarding the others.
+    for result, section_opcao, subopcao_value in planned:
+        failed_years = []
+        deadline_hit = False
+        for year in result["years"]:
+            data_or_exc = page_data[(section_opcao, subopcao_value, year)]
+            if isinstance(data_or_exc, Exception):
+                print(f"Batch: failed to fetch {section_opcao}/{subopcao_value} year {year}: {data_or_exc}")
+                failed_years.append(year)
+                deadline_hit = deadline_hit or isinstance(data_or_exc, DeadlineExceeded)
+                continue
+            result["data"].extend(data_or_exc)
+        if failed_years:
+            if len(failed_years) < len(result["years"]):
+                status_code = 206
+            else:
+                status_code = 504 if deadline_hit else 502
+            _fail(result, status_code, f"Falha ao buscar dados dos anos: {', '.join(map(str, failed_years))}")
+
+    return {"results": results}
@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Query, HTTPException, Depends
+
+from ..scraper.changes import change_log
+from ..auth.security import ensure_authenticated
+from .admission import admit_light
+from .schemas import ChangesResponse
+
+router = APIRouter(
+    prefix="/changes",
+    tags=["Alterações"],
+    dependencies=[Depends(ensure_authenticated)]
+)
+
+@router.get("",
+            dependencies=[Depends(admit_light)],
+            summary="Obtém as alterações detectadas nos dados desde um cursor",
+            description="Retorna as linhas adicionadas, alteradas ou removidas entre raspagens sucessivas de cada tabela (seção, subopção, ano). "
+                        "Use o `next_cursor` da resposta como `since` na próxima chamada. Quando `truncated` é verdadeiro, "
+                        "parte das alterações não está mais disponível e os dados devem ser recarregados por completo. "
+                        "O feed é mantido apenas em memória, por instância: após cada reinício ou deploy do serviço, "
+                        "ou quando a chamada é atendida por outra instância, o cursor anterior não é reconhecido e "
+                        "a resposta vem com `truncated` verdadeiro.",
+            response_model=ChangesResponse)
+async def get_changes_route(
+    since: str = Query("0", description="Cursor retornado pela chamada anterior (0 para o início do feed)"),
+    limit: int = Query(1000, ge=1, le=10000, description="Número máximo de alterações retornadas")
+):
+    try:
+        entries, next_cursor, truncated = change_log.changes_since(since, limit)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Cursor inválido: '{since}'.")
+    return {"changes": entries, "next_cursor": next_cursor, "truncated": truncated}
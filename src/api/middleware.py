@@ -0,0 +1,69 @@
+import asyncio
+from typing import Optional
+
+from ..config import settings
+from ..scraper.core import set_request_deadline
+
+DEADLINE_HEADER = b"x-deadline-seconds"
+
+def _deadline_from_scope(scope) -> Optional[float]:
+    """Deadline budget in seconds: the X-Deadline-Seconds header when valid, else REQUEST_DEADLINE_SECONDS."""
+    for name, value in scope.get("headers", []):
+        if name == DEADLINE_HEADER:
+            try:
+                requested = float(value.decode("latin-1"))
+            except ValueError:
+                break
+            if requested > 0:
+                return min(requested, settings.REQUEST_MAX_DEADLINE_SECONDS)
+            break
+    return settings.REQUEST_DEADLINE_SECONDS or None
+
+class RequestBudgetMiddleware:
+    """
+    Pure ASGI middleware that sets the request deadline budget for the scraper and cancels the
+    handler when the client disconnects. Upstream loads shared with other requests keep running.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        set_request_deadline(_deadline_from_scope(scope))
+
+        # Every message from the server goes through this queue, so the handler still sees the request
+        # body while the watcher below notices the disconnect as soon as it arrives.
+        messages: asyncio.Queue = asyncio.Queue()
+        disconnected = asyncio.Event()
+
+        async def watch_disconnect():
+            while True:
+                message = await receive()
+                await messages.put(message)
+                if message["type"] == "http.disconnect":
+                    disconnected.set()
+                    return
+
+        app_task = asyncio.ensure_future(self.app(scope, messages.get, send))
+        watcher = asyncio.ensure_future(watch_disconnect())
+        disconnect_wait = asyncio.ensure_future(disconnected.wait())
+        try:
+            await asyncio.wait({app_task, disconnect_wait}, return_when=asyncio.FIRST_COMPLETED)
+            if not app_task.done():
+                print(f"Client disconnected, cancelling {scope.get('method')} {scope.get('path')}")
+                app_task.cancel()
+                try:
+                    await app_task
+                except asyncio.CancelledError:
+                    pass
+                return
+            app_task.result()
+        finally:
+            watcher.cancel()
+            disconnect_wait.cancel()
+            if not app_task.done():
+                app_task.cancel()
@@ -0,0 +1,105 @@
+import base64
+import binascii
+import bisect
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, Query
+
+from ..config import settings
+from ..scraper.changes import row_key
+
+YearTable = Tuple[int, List[Dict[str, Any]]]
+KeyIndex = List[Tuple[Tuple[str, str], int]]
+
+class PageRequest:
+    def __init__(self, cursor: Optional[str], limit: Optional[int], fields: Optional[List[str]]):
+        self.cursor = cursor
+        self.limit = limit
+        self.fields = fields
+
+    @property
+    def paginated(self) -> bool:
+        return self.cursor is not None or self.limit is not None
+
+async def page_request(
+    cursor: Optional[str] = Query(None, description="Cursor retornado em `next_cursor` pela página anterior"),
+    limit: Optional[int] = Query(None, ge=1, le=settings.PAGE_MAX_LIMIT, description="Número máximo de linhas por página"),
+    fields: Optional[str] = Query(None, description="Campos a retornar em cada linha, separados por vírgula (ex: Produto,Ano)")
+) -> PageRequest:
+    field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+    return PageRequest(cursor, limit, field_list or None)
+
+def encode_cursor(year: int, last_row: Dict[str, Any]) -> str:
+    payload = json.dumps([year, list(row_key(last_row))], ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[int, Tuple[str, str]]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        year, key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        return int(year), (str(key[0]), str(key[1]))
+    except (ValueError, TypeError, IndexError, binascii.Error, UnicodeError):
+        raise HTTPException(status_code=400, detail=f"Cursor inválido: '{cursor}'.")
+
+def _key_index(rows: List[Dict[str, Any]]) -> KeyIndex:
+    # Cached tables carry their index (YearRows); anything else is indexed on the fly.
+    key_index = getattr(rows, "key_index", None)
+    if key_index is None:
+        key_index = sorted((row_key(row), position) for position, row in enumerate(rows))
+    return key_index
+
+def _start_position(tables: List[YearTable], cursor: Optional[str]) -> Tuple[int, int]:
+    """(table index, key index position) of the first row whose item key follows the cursor key."""
+    if cursor is None:
+        return 0, 0
+    year, key = decode_cursor(cursor)
+    for table_idx, (table_year, rows) in enumerate(tables):
+        if table_year < year:
+            continue
+        if table_year > year:
+            return table_idx, 0
+        return table_idx, bisect.bisect_right(_key_index(rows), key, key=lambda entry: entry[0])
+    return len(tables), 0
+
+def _project(rows: List[Dict[str, Any]], fields: Optional[List[str]]) -> List[Dict[str, Any]]:
+    if not fields:
+        return rows
+    return [{field: row[field] for field in fields if field in row} for row in rows]
+
+def build_data_response(result: Dict[str, Any], page: PageRequest) -> Dict[str, Any]:
+    """
+    Builds a DataResponse from `fetch_embrapa_tables` output. Only the rows of the requested page are
+    copied (and projected); the cached per-year lists and their key indexes are only read.
+    """
+    tables: List[YearTable] = result["tables"]
+    response = {key: value for key, value in result.items() if key != "tables"}
+
+    if not page.paginated:
+        response["data"] = [row for _, rows in tables for row in _project(rows, page.fields)]
+        return response
+
+    limit = page.limit or settings.PAGE_MAX_LIMIT
+    # Paginated responses walk each year in item-key order, so a cursor resumes at the next key and a
+    # refresh that reorders, inserts or removes rows never repeats one or skips one present in both versions.
+    table_idx, index_pos = _start_position(tables, page.cursor)
+    page_rows: List[Dict[str, Any]] = []
+    last: Optional[Tuple[int, Dict[str, Any]]] = None
+    while table_idx < len(tables) and len(page_rows) < limit:
+        year, rows = tables[table_idx]
+        key_index = _key_index(rows)
+        chunk = [rows[position] for _, position in key_index[index_pos:index_pos + limit - len(page_rows)]]
+        if chunk:
+            page_rows.extend(_project(chunk, page.fields))
+            index_pos += len(chunk)
+            last = (year, chunk[-1])
+        if index_pos >= len(rows):
+            table_idx, index_pos = table_idx + 1, 0
+
+    has_more = any(
+        len(rows) > (index_pos if idx == table_idx else 0)
+        for idx, (_, rows) in enumerate(tables[table_idx:], start=table_idx)
+    )
+    response["data"] = page_rows
+    response["next_cursor"] = encode_cursor(*last) if has_more and last is not None else None
+    return response
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, List, Dict, Any
 
 class UserLoginRequest(BaseModel):
     username: str
@@ -10,4 +10,49 @@ class TokenResponse(BaseModel):
     token_type: str = "bearer"
 
 class ErrorResponse(BaseModel):
-    detail: str
\ No newline at end of file
+    detail: str
+
+class DataResponse(BaseModel):
+    data: List[Dict[str, Any]]
+    partial: bool = False
+    missing_years: Optional[List[int]] = None
+    next_cursor: Optional[str] = None
+
+class ChangeEntry(BaseModel):
+    cursor: str
+    section: str
+    subopcao: Optional[str] = None
+    ano: int
+    item: str
+    categoria: Optional[str] = None
+    change: str
+    values: Optional[Dict[str, Any]] = None
+    previous: Optional[Dict[str, Any]] = None
+    detected_at: str
+
+class ChangesResponse(BaseModel):
+    changes: List[ChangeEntry]
+    next_cursor: str
+    truncated: bool = False
+
+class BatchQuery(BaseModel):
+    section: str
+    subopcao: Optional[str] = None
+    year: Optional[int] = None
+    year_start: Optional[int] = None
+    year_end: Optional[int] = None
+    all_years: bool = False
+
+class BatchRequest(BaseModel):
+    queries: List[BatchQuery]
+
+class BatchQueryResult(BaseModel):
+    index: int
+    query: BatchQuery
+    years: List[int] = []
+    data: List[Dict[str, Any]] = []
+    status_code: int = 200
+    error: Optional[str] = None
+
+class BatchResponse(BaseModel):
+    results: List[BatchQueryResult]
@@ -0,0 +1,201 @@
+from fastapi import APIRouter, Path, Query, HTTPException, Depends
+from typing import List, Dict, Any, Optional, Literal, Tuple, Awaitable
+
+from ..scraper.core import (
+    fetch_embrapa_tables,
+    get_year_range,
+    get_available_suboptions,
+    DeadlineExceeded
+)
+from ..scraper.registry import SECTIONS, SectionSpec
+from ..auth.security import ensure_authenticated
+from .admission import admit_heavy, admit_light
+from .pagination import PageRequest, page_request, build_data_response
+from .schemas import DataResponse
+
+ENGINE_QUERY_DESCRIPTION = "Motor de ingestão: 'html' (uma página por ano) ou 'csv' (download completo)"
+
+async def _call_scraper(awaitable: Awaitable[Any], failure_detail: str) -> Any:
+    """Awaits a scraper call, mapping deadline errors to 504 and any other failure to 500."""
+    try:
+        return await awaitable
+    except HTTPException as http_exc:
+        raise http_exc
+    except DeadlineExceeded as exc:
+        raise HTTPException(status_code=504, detail=f"{failure_detail}: {str(exc)}")
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"{failure_detail}: {str(exc)}")
+
+def _check_year(year: int, year_range: Tuple[int, int], label: str) -> None:
+    min_year, max_year = year_range
+    if not (min_year <= year <= max_year):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Ano {year} fora do intervalo para {label}. Intervalo disponível: [{min_year}-{max_year}]"
+        )
+
+async def _resolve_year_range(spec: SectionSpec, subopcao_value: Optional[str], label: str) -> Tuple[int, int]:
+    min_year, max_year = await _call_scraper(
+        get_year_range(section_opcao=spec.opcao, subopcao_value=subopcao_value),
+        f"Falha ao determinar o intervalo de anos para {label}"
+    )
+    if min_year is None or max_year is None:
+        raise HTTPException(status_code=404, detail=f"Não foi possível determinar o intervalo de anos para {label}.")
+    return min_year, max_year
+
+def _add_section_routes(router: APIRouter, spec: SectionSpec) -> None:
+    name = spec.name_pt
+
+    async def section_year_range() -> Tuple[int, int]:
+        return await _resolve_year_range(spec, None, name)
+
+    @router.get("/all",
+                dependencies=[Depends(admit_heavy)],
+                name=f"get_{spec.key}_all_years_route",
+                summary=f"Obtém todos os dados de {name} de todos os anos disponíveis",
+                description=f"Retorna uma lista de todos os produtos/itens da seção '{name}' com seus respectivos dados para cada ano disponível no site da Embrapa.",
+                response_model=DataResponse)
+    async def get_all_years_route(
+        engine: Optional[Literal["html", "csv"]] = Query(None, description=ENGINE_QUERY_DESCRIPTION),
+        page: PageRequest = Depends(page_request)
+    ):
+        result = await _call_scraper(
+            fetch_embrapa_tables(section_opcao=spec.opcao, all_years=True, engine=engine),
+            f"Falha ao buscar todos os dados de {name}"
+        )
+        return build_data_response(result, page)
+
+    @router.get("/year/{year}",
+                dependencies=[Depends(admit_light)],
+                name=f"get_{spec.key}_by_year_route",
+                summary=f"Obtém dados de {name} para um ano específico",
+                description=f"Retorna os dados de {name} para o ano especificado. O ano deve estar dentro do intervalo disponível no site da Embrapa.",
+                response_model=DataResponse)
+    async def get_by_year_route(
+        year: int = Path(..., title="Ano", description="O ano para o qual buscar os dados (ex: 2020)"),
+        year_range: Tuple[int, int] = Depends(section_year_range),
+        page: PageRequest = Depends(page_request)
+    ):
+        _check_year(year, year_range, name)
+        result = await _call_scraper(
+            fetch_embrapa_tables(section_opcao=spec.opcao, year_to_fetch=year),
+            f"Falha ao buscar dados de {name} para o ano {year}"
+        )
+        return build_data_response(result, page)
+
+    @router.get("",
+                dependencies=[Depends(admit_light)],
+                name=f"get_{spec.key}_latest_year_route",
+                summary=f"Obtém dados de {name} do último ano disponível",
+                description=f"Retorna os dados de {name} referentes ao ano mais recente com dados disponíveis no site da Embrapa.",
+                response_model=DataResponse)
+    async def get_latest_year_route(
+        year_range: Tuple[int, int] = Depends(section_year_range),
+        page: PageRequest = Depends(page_request)
+    ):
+        result = await _call_scraper(
+            fetch_embrapa_tables(section_opcao=spec.opcao, year_to_fetch=year_range[1]),
+            f"Falha ao buscar os dados mais recentes de {name}"
+        )
+        return build_data_response(result, page)
+
+def _add_suboption_routes(router: APIRouter, spec: SectionSpec) -> None:
+    name = spec.name_pt
+
+    async def resolve_suboption(
+        subopcao_value: str = Path(..., title="Valor da Subopção", description="O valor da subopção (ex: subopt_01)")
+    ) -> Dict[str, str]:
+        available_subs = await _call_scraper(
+            get_available_suboptions(section_opcao=spec.opcao),
+            f"Falha ao listar subopções para {name}"
+        )
+        for sub in available_subs:
+            if sub['value'] == subopcao_value:
+                return sub
+        raise HTTPException(status_code=404, detail=f"Subopção '{subopcao_value}' não encontrada para {name}.")
+
+    async def suboption_year_range(sub: Dict[str, str] = Depends(resolve_suboption)) -> Tuple[int, int]:
+        return await _resolve_year_range(spec, sub['value'], f"{name}/{sub['value']}")
+
+    @router.get("/suboptions",
+                dependencies=[Depends(admit_light)],
+                name=f"list_{spec.key}_suboptions_route",
+                summary=f"Lista as subopções disponíveis para {name}",
+                description=f"Retorna uma lista de nomes e valores das subopções ({spec.suboption_kind_pt}, como '{spec.suboption_example_pt}') disponíveis na seção de {name} do site da Embrapa.",
+                response_model=List[Dict[str, str]])
+    async def list_suboptions_route():
+        return await _call_scraper(
+            get_available_suboptions(section_opcao=spec.opcao),
+            f"Falha ao listar subopções para {name}"
+        )
+
+    @router.get("/{subopcao_value}/all",
+                dependencies=[Depends(admit_heavy)],
+                name=f"get_{spec.key}_suboption_all_years_route",
+                summary=f"Obtém todos os dados de uma subopção de {name} de todos os anos",
+                description=f"Retorna dados agregados para uma subopção específica de {name} (ex: '{spec.suboption_example_pt}'), abrangendo todos os anos disponíveis no site da Embrapa.",
+                response_model=DataResponse)
+    async def get_suboption_all_years_route(
+        sub: Dict[str, str] = Depends(resolve_suboption),
+        engine: Optional[Literal["html", "csv"]] = Query(None, description=ENGINE_QUERY_DESCRIPTION),
+        page: PageRequest = Depends(page_request)
+    ):
+        result = await _call_scraper(
+            fetch_embrapa_tables(section_opcao=spec.opcao, subopcao_value=sub['value'], all_years=True,
+                                 engine=engine, suboption_name=sub['name']),
+            f"Falha ao buscar todos os dados para {name}/{sub['value']}"
+        )
+        return build_data_response(result, page)
+
+    @router.get("/{subopcao_value}/year/{year}",
+                dependencies=[Depends(admit_light)],
+                name=f"get_{spec.key}_suboption_by_year_route",
+                summary=f"Obtém dados de uma subopção de {name} para um ano específico",
+                description=f"Retorna dados para uma subopção específica de {name} e para um ano específico. O ano deve estar dentro do intervalo disponível para a subopção.",
+                response_model=DataResponse)
+    async def get_suboption_by_year_route(
+        year: int = Path(..., title="Ano"),
+        sub: Dict[str, str] = Depends(resolve_suboption),
+        year_range: Tuple[int, int] = Depends(suboption_year_range),
+        page: PageRequest = Depends(page_request)
+    ):
+        _check_year(year, year_range, f"{name}/{sub['value']}")
+        result = await _call_scraper(
+            fetch_embrapa_tables(section_opcao=spec.opcao, subopcao_value=sub['value'], year_to_fetch=year,
+                                 suboption_name=sub['name']),
+            f"Falha ao buscar dados para {name}/{sub['value']} ano {year}"
+        )
+        return build_data_response(result, page)
+
+    @router.get("/{subopcao_value}",
+                dependencies=[Depends(admit_light)],
+                name=f"get_{spec.key}_suboption_latest_year_route",
+                summary=f"Obtém dados de uma subopção de {name} do último ano disponível",
+                description=f"Retorna dados para uma subopção específica de {name}, referentes ao ano mais recente com dados disponíveis para essa subopção.",
+                response_model=DataResponse)
+    async def get_suboption_latest_year_route(
+        sub: Dict[str, str] = Depends(resolve_suboption),
+        year_range: Tuple[int, int] = Depends(suboption_year_range),
+        page: PageRequest = Depends(page_request)
+    ):
+        result = await _call_scraper(
+            fetch_embrapa_tables(section_opcao=spec.opcao, subopcao_value=sub['value'], year_to_fetch=year_range[1],
+                                 suboption_name=sub['name']),
+            f"Falha ao buscar os dados mais recentes para {name}/{sub['value']}"
+        )
+        return build_data_response(result, page)
+
+def build_section_router(spec: SectionSpec) -> APIRouter:
+    """Builds the data routes of one registry section; sections with suboptions nest them under /{subopcao_value}."""
+    router = APIRouter(
+        prefix=spec.prefix,
+        tags=[spec.name_pt],
+        dependencies=[Depends(ensure_authenticated)]
+    )
+    if spec.has_suboptions:
+        _add_suboption_routes(router, spec)
+    else:
+        _add_section_routes(router, spec)
+    return router
+
+section_routers: List[APIRouter] = [build_section_router(spec) for spec in SECTIONS]
@@ -1,3 +1,4 @@
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
@@ -11,6 +12,35 @@ class Settings(BaseSettings):
     TIMEOUT: int = 30
     SCRAPER_MAX_CONCURRENCY: int = 5
     SCRAPER_RETRY_ATTEMPTS: int = 3
+    SCRAPER_CACHE_TTL_SECONDS: int = 3600
+    SCRAPER_METADATA_TTL_SECONDS: int = 21600
+    SCRAPER_ENGINE: str = "html"
+    SCRAPER_CSV_CONSISTENCY_CHECK: bool = False
+
+    SCRAPER_REFRESH_ENABLED: bool = True
+    SCRAPER_REFRESH_INTERVAL_SECONDS: int = 900
+    SCRAPER_REFRESH_JITTER_SECONDS: int = 30
+    SCRAPER_METADATA_REFRESH_INTERVAL_SECONDS: int = 18000
+
+    CHANGES_MAX_ENTRIES: int = 100000
+
+    BATCH_MAX_QUERIES: int = 50
+
+    REQUEST_DEADLINE_SECONDS: float = 30
+    REQUEST_MAX_DEADLINE_SECONDS: float = 120
+
+    PAGE_MAX_LIMIT: int = 5000
+
+    ADMISSION_HEAVY_MAX_CONCURRENCY: int = 4
+    ADMISSION_HEAVY_MAX_QUEUE: int = 8
+    ADMISSION_HEAVY_QUEUE_TIMEOUT_SECONDS: float = 10
+    QUOTA_HEAVY_PER_MINUTE: float = 6
+    QUOTA_HEAVY_BURST: int = Field(3, ge=1)
+    QUOTA_LIGHT_PER_MINUTE: float = 120
+    QUOTA_LIGHT_BURST: int = Field(30, ge=1)
+
+    SNAPSHOT_PATH: Optional[str] = None
+    SNAPSHOT_MAX_AGE_SECONDS: int = 604800
 
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
@@ -40,6 +70,19 @@ class Settings(BaseSettings):
     APPINSIGHTS_CONNECTION_STRING: Optional[str] = None
     KEYVAULT_URI: Optional[str] = None
 
+    @model_validator(mode="after")
+    def _check_refresh_keeps_metadata_warm(self) -> "Settings":
+        # Suboption lists are re-discovered at most one cycle (interval plus start and per-target jitter)
+        # after the metadata refresh interval elapses; that must happen before the cached lists expire.
+        worst_case = (self.SCRAPER_METADATA_REFRESH_INTERVAL_SECONDS + self.SCRAPER_REFRESH_INTERVAL_SECONDS
+                      + 2 * self.SCRAPER_REFRESH_JITTER_SECONDS)
+        if self.SCRAPER_REFRESH_ENABLED and worst_case >= self.SCRAPER_METADATA_TTL_SECONDS:
+            raise ValueError(
+                "SCRAPER_METADATA_REFRESH_INTERVAL_SECONDS + SCRAPER_REFRESH_INTERVAL_SECONDS + "
+                "2 * SCRAPER_REFRESH_JITTER_SECONDS must be lower than SCRAPER_METADATA_TTL_SECONDS."
+            )
+        return self
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
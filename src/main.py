@@ -1,6 +1,11 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from .api.routes import router
+from .api.middleware import RequestBudgetMiddleware
 from .auth.security import API_KEY_SCHEME_NAME_FOR_SWAGGER
+from .config import settings
+from .scraper.scheduler import refresh_scheduler
+from .scraper.snapshot import load_snapshot, unload_snapshot
 
 openapi_components = {
     "securitySchemes": {
@@ -13,11 +18,24 @@ openapi_components = {
     }
 }
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    snapshot = load_snapshot(settings.SNAPSHOT_PATH) if settings.SNAPSHOT_PATH else None
+    if settings.SCRAPER_REFRESH_ENABLED:
+        # With a warm snapshot, an immediate full refresh would hit the site from every worker at boot.
+        refresh_scheduler.start(initial_delay_seconds=refresh_scheduler.interval_seconds if snapshot else 0)
+    yield
+    await refresh_scheduler.stop()
+    unload_snapshot(snapshot)
+
 app = FastAPI(
     title="Web-Scraper API Embrapa",
-    openapi_components=openapi_components
+    openapi_components=openapi_components,
+    lifespan=lifespan
 )
 
+app.add_middleware(RequestBudgetMiddleware)
+
 app.include_router(router, prefix="/api/v1")
 
 if __name__ == "__main__":
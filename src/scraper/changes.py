@@ -0,0 +1,126 @@
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from ..config import settings
+
+CHANGE_ADDED = "added"
+CHANGE_UPDATED = "updated"
+CHANGE_REMOVED = "removed"
+
+TableKey = Tuple[str, Optional[str], int]
+ItemKey = Tuple[str, str]
+
+def row_key(row: Dict[str, Any]) -> ItemKey:
+    # The first key of a parsed row is always the item column ('Produto', 'Cultivar', 'Países', ...).
+    item_name = str(next(iter(row.values()), ""))
+    return row.get("Categoria_Principal", ""), item_name
+
+class ChangeLog:
+    """
+    Keeps the last parsed version of every (section, suboption, year) table and records
+    row-level deltas whenever a newly parsed table differs from it.
+    The first time a table is seen it becomes the baseline and produces no deltas.
+
+    Each ingestion engine keeps its own baseline, so normalization differences between the
+    HTML and CSV engines are never reported as changes. Cursors are "<epoch>:<sequence>",
+    where the epoch identifies this in-memory log (one per worker process): a cursor from
+    another epoch cannot be resumed and yields a truncated response.
+
+    Nothing is persisted: a restart or deploy starts a new epoch, so consumers get a truncated
+    response and reload once. Baselines hold the same row dicts as the year-table cache, so
+    they cost at most one extra table per engine for every (section, suboption, year).
+    """
+
+    def __init__(self, max_entries: int = settings.CHANGES_MAX_ENTRIES):
+        self.epoch = uuid.uuid4().hex[:12]
+        self._tables: Dict[Tuple[TableKey, str], Dict[ItemKey, Dict[str, Any]]] = {}
+        self._entries: Deque[Dict[str, Any]] = deque(maxlen=max_entries)
+        self._last_sequence = 0
+
+    @property
+    def last_cursor(self) -> str:
+        return self.format_cursor(self._last_sequence)
+
+    def format_cursor(self, sequence: int) -> str:
+        return f"{self.epoch}:{sequence}"
+
+    def record_table(self, section_opcao: str, subopcao_value: Optional[str], year: int,
+                     rows: List[Dict[str, Any]], engine: str) -> int:
+        """Diffs `rows` against the previous version of the table parsed by the same engine. Returns the number of deltas recorded."""
+        table_key = (section_opcao, subopcao_value, year)
+        new_rows = {row_key(row): row for row in rows}
+        previous_rows = self._tables.get((table_key, engine))
+        self._tables[(table_key, engine)] = new_rows
+        if previous_rows is None:
+            return 0
+
+        detected_at = datetime.now(timezone.utc).isoformat()
+        recorded = 0
+        for item_key, row in new_rows.items():
+            previous = previous_rows.get(item_key)
+            if previous is None:
+                self._append(table_key, item_key, CHANGE_ADDED, row, None, detected_at)
+                recorded += 1
+            elif previous != row:
+                self._append(table_key, item_key, CHANGE_UPDATED, row, previous, detected_at)
+                recorded += 1
+        for item_key, previous in previous_rows.items():
+            if item_key not in new_rows:
+                self._append(table_key, item_key, CHANGE_REMOVED, None, previous, detected_at)
+                recorded += 1
+        if recorded:
+            print(f"Detected {recorded} changed rows for {section_opcao}/{subopcao_value} year {year}.")
+        return recorded
+
+    def _append(self, table_key: TableKey, item_key: ItemKey, change: str,
+                values: Optional[Dict[str, Any]], previous: Optional[Dict[str, Any]],
+                detected_at: str) -> None:
+        self._last_sequence += 1
+        section_opcao, subopcao_value, year = table_key
+        categoria, item = item_key
+        self._entries.append({
+            "cursor": self.format_cursor(self._last_sequence),
+            "section": section_opcao,
+            "subopcao": subopcao_value,
+            "ano": year,
+            "item": item,
+            "categoria": categoria or None,
+            "change": change,
+            "values": values,
+            "previous": previous,
+            "detected_at": detected_at,
+        })
+
+    def changes_since(self, cursor: str, limit: int) -> Tuple[List[Dict[str, Any]], str, bool]:
+        """
+        Returns (entries after `cursor`, next cursor, truncated). "0" or an empty cursor starts from the beginning.
+        `truncated` is True when entries after `cursor` were already evicted, or the cursor belongs to another
+        epoch (a previous process or another worker), and the consumer must reload.
+        Raises ValueError for malformed cursors.
+        """
+        if cursor in ("", "0"):
+            sequence, truncated = 0, False
+        else:
+            epoch, separator, raw_sequence = cursor.partition(":")
+            if not separator or not raw_sequence.isdigit():
+                raise ValueError(f"Malformed change cursor: {cursor!r}")
+            sequence = int(raw_sequence)
+            if epoch != self.epoch or sequence > self._last_sequence:
+                # The feed this cursor came from is gone: replay what is retained here.
+                sequence, truncated = 0, True
+            else:
+                truncated = False
+        # Sequences are contiguous, so the first entry after `sequence` can be located by offset.
+        oldest_sequence = self._last_sequence - len(self._entries) + 1
+        truncated = truncated or (sequence + 1 < oldest_sequence and sequence < self._last_sequence)
+
+        start = max(sequence + 1 - oldest_sequence, 0)
+        entries: List[Dict[str, Any]] = [
+            self._entries[index] for index in range(start, min(start + limit, len(self._entries)))
+        ]
+        next_sequence = oldest_sequence + start + len(entries) - 1 if entries else sequence
+        return entries, self.format_cursor(next_sequence), truncated
+
+change_log = ChangeLog()
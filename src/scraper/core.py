@@ -1,26 +1,116 @@
 import httpx
 from bs4 import BeautifulSoup, Tag
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Set, Tuple, Any, Callable, Awaitable
+import csv
 import re
-from asyncio import gather
+import time
+from asyncio import gather, shield, ensure_future, wait_for, Semaphore, Task
+import asyncio
+from contextvars import ContextVar
 
 from ..config import settings
+from .changes import change_log, row_key
+from .registry import OPCAO_MAP, SECTIONS_WITH_SUBOPTIONS, CSV_DOWNLOAD_MAP
 
-OPCAO_MAP = {
-    "producao": "opt_02",
-    "processamento": "opt_03",
-    "comercializacao": "opt_04",
-    "importacao": "opt_05",
-    "exportacao": "opt_06",
-}
+ENGINE_HTML = "html"
+ENGINE_CSV = "csv"
 
-async def _make_request(url: str, params: Optional[Dict[str, Any]] = None) -> BeautifulSoup:
-    """Helper function to make HTTP GET request and return BeautifulSoup soup."""
+# Global budget of simultaneous requests to the Embrapa site, shared by route handlers and the refresh scheduler.
+_request_semaphore = Semaphore(settings.SCRAPER_MAX_CONCURRENCY)
+
+# In-memory caches: key -> (stored_at, value)
+_suboptions_cache: Dict[str, Tuple[float, List[Dict[str, str]]]] = {}
+_year_range_cache: Dict[Tuple[str, Optional[str]], Tuple[float, Tuple[Optional[int], Optional[int]]]] = {}
+_year_data_cache: Dict[Tuple[str, Optional[str], int], Tuple[float, List[Dict[str, Any]]]] = {}
+
+# Snapshot loaded at startup (see scraper/snapshot.py); each year table is decoded from it on first use only.
+_snapshot_reader: Optional[Any] = None
+
+def attach_snapshot(reader: Optional[Any]) -> None:
+    global _snapshot_reader
+    _snapshot_reader = reader
+
+def _cache_get(cache: Dict[Any, Tuple[float, Any]], key: Any, ttl: int) -> Optional[Any]:
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    stored_at, value = entry
+    if time.monotonic() - stored_at > ttl:
+        return None
+    return value
+
+def _cache_set(cache: Dict[Any, Tuple[float, Any]], key: Any, value: Any) -> None:
+    cache[key] = (time.monotonic(), value)
+
+class DeadlineExceeded(Exception):
+    """Raised when the deadline budget of the current request runs out before the data is available."""
+
+# Absolute time.monotonic() deadline of the request being served, None when unbounded.
+_request_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+def set_request_deadline(seconds: Optional[float]) -> None:
+    _request_deadline.set(time.monotonic() + seconds if seconds else None)
+
+def _remaining_budget() -> Optional[float]:
+    deadline = _request_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+class _Flight:
+    def __init__(self, task: Task):
+        self.task = task
+        self.waiters = 0
+
+# Loads currently in progress, so concurrent callers asking for the same page share one upstream request.
+_inflight: Dict[Any, _Flight] = {}
+
+async def _detached(load: Callable[[], Awaitable[Any]]) -> Any:
+    # Shared loads are bounded by the per-page TIMEOUT only; each waiter applies its own deadline.
+    _request_deadline.set(None)
+    return await load()
+
+async def _single_flight(key: Any, load: Callable[[], Awaitable[Any]]) -> Any:
+    flight = _inflight.get(key)
+    if flight is None:
+        flight = _Flight(ensure_future(_detached(load)))
+        _inflight[key] = flight
+
+        def _forget(done: Task, flight: _Flight = flight) -> None:
+            if _inflight.get(key) is flight:
+                del _inflight[key]
+            if not done.cancelled():
+                done.exception()  # Mark as retrieved when every waiter already left.
+
+        flight.task.add_done_callback(_forget)
+
+    flight.waiters += 1
+    try:
+        remaining = _remaining_budget()
+        # Shielded so that one waiter being cancelled or timing out does not abort the load for the others.
+        if remaining is None:
+            return await shield(flight.task)
+        if remaining <= 0:
+            raise DeadlineExceeded(f"Deadline exceeded before loading {key}")
+        try:
+            return await wait_for(shield(flight.task), remaining)
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(f"Deadline exceeded while loading {key}") from None
+    finally:
+        flight.waiters -= 1
+        if flight.waiters == 0 and not flight.task.done():
+            # Nobody is waiting anymore (client gone or deadline hit): stop the upstream work.
+            flight.task.cancel()
+
+def _build_url(url: str) -> str:
     base_url_to_use = settings.TARGET_BASE_URL
     if not base_url_to_use.endswith('/'):
         base_url_to_use += '/'
-    
-    full_url = f"{base_url_to_use}{url.lstrip('/')}"
+    return f"{base_url_to_use}{url.lstrip('/')}"
+
+async def _make_request(url: str, params: Optional[Dict[str, Any]] = None) -> BeautifulSoup:
+    """Helper function to make HTTP GET request and return BeautifulSoup soup."""
+    full_url = _build_url(url)
 
     async with httpx.AsyncClient(
         headers={"User-Agent": settings.USER_AGENT or "Mozilla/5.0"},
@@ -29,7 +119,8 @@ async def _make_request(url: str, params: Optional[Dict[str, Any]] = None) -> Be
     ) as client:
         try:
             print(f"Requesting URL: {full_url} with params: {params}")
-            response = await client.get(full_url, params=params)
+            async with _request_semaphore:
+                response = await client.get(full_url, params=params)
             response.raise_for_status()
             print(f"Response status: {response.status_code} for {response.url}")
             return BeautifulSoup(response.text, "html.parser")
@@ -43,10 +134,18 @@ async def _make_request(url: str, params: Optional[Dict[str, Any]] = None) -> Be
         except httpx.RequestError as exc:
             raise Exception(f"Request error while fetching {exc.request.url}: {exc}") from exc
 
-async def get_available_suboptions(section_opcao: str) -> List[Dict[str, str]]:
-    if section_opcao not in [OPCAO_MAP["processamento"], OPCAO_MAP["importacao"], OPCAO_MAP["exportacao"]]:
+async def get_available_suboptions(section_opcao: str, force_refresh: bool = False) -> List[Dict[str, str]]:
+    if section_opcao not in SECTIONS_WITH_SUBOPTIONS:
         return []
-    
+
+    if not force_refresh:
+        cached = _cache_get(_suboptions_cache, section_opcao, settings.SCRAPER_METADATA_TTL_SECONDS)
+        if cached is not None:
+            return cached
+
+    return await _single_flight(("suboptions", section_opcao), lambda: _load_suboptions(section_opcao))
+
+async def _load_suboptions(section_opcao: str) -> List[Dict[str, str]]:
     soup = await _make_request("index.php", params={"opcao": section_opcao})
     suboptions: List[Dict[str, str]] = []
     
@@ -60,9 +159,22 @@ async def get_available_suboptions(section_opcao: str) -> List[Dict[str, str]]:
             
     if not suboptions:
         print(f"Warning: Could not find suboption buttons for {section_opcao} using main selectors.")
+    else:
+        _cache_set(_suboptions_cache, section_opcao, suboptions)
     return suboptions
 
-async def get_year_range(section_opcao: str, subopcao_value: Optional[str] = None) -> Tuple[Optional[int], Optional[int]]:
+async def get_year_range(section_opcao: str, subopcao_value: Optional[str] = None,
+                         force_refresh: bool = False) -> Tuple[Optional[int], Optional[int]]:
+    cache_key = (section_opcao, subopcao_value)
+    if not force_refresh:
+        cached = _cache_get(_year_range_cache, cache_key, settings.SCRAPER_METADATA_TTL_SECONDS)
+        if cached is not None:
+            return cached
+
+    return await _single_flight(("year_range",) + cache_key, lambda: _load_year_range(section_opcao, subopcao_value))
+
+async def _load_year_range(section_opcao: str, subopcao_value: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    cache_key = (section_opcao, subopcao_value)
     url_params = {"opcao": section_opcao}
     if subopcao_value:
         url_params["subopcao"] = subopcao_value
@@ -87,6 +199,7 @@ async def get_year_range(section_opcao: str, subopcao_value: Optional[str] = Non
     if match:
         min_year = int(match.group(1))
         max_year = int(match.group(2))
+        _cache_set(_year_range_cache, cache_key, (min_year, max_year))
         return min_year, max_year
     
     print(f"Warning: Could not parse year range from '{year_range_text_element}' for {section_opcao} (suboption: {subopcao_value}).")
@@ -193,14 +306,292 @@ def _parse_single_year_summary_table(soup: BeautifulSoup, year_fetched: int,
             
     return extracted_data
 
-async def fetch_embrapa_data(section_opcao: str,
-                             year_to_fetch: Optional[int] = None,
-                             all_years: bool = False,
-                             subopcao_value: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
-    """ Main data fetching and parsing orchestrator. """
+async def fetch_year_table(section_opcao: str, year: int,
+                           subopcao_value: Optional[str] = None,
+                           suboption_name: Optional[str] = None,
+                           force_refresh: bool = False) -> List[Dict[str, Any]]:
+    """Fetches and parses a single year page, serving it from the in-memory cache when fresh."""
+    cache_key = (section_opcao, subopcao_value, year)
+    if not force_refresh:
+        cached = _cache_get(_year_data_cache, cache_key, settings.SCRAPER_CACHE_TTL_SECONDS)
+        if cached is not None:
+            return cached
+        if _snapshot_reader is not None:
+            # Each snapshot table is served once, cached as fresh; after that entry expires the page is scraped again.
+            snapshot_data = _snapshot_reader.take_table(cache_key)
+            if snapshot_data is not None:
+                return _store_year_table(cache_key, snapshot_data, _snapshot_reader.engine)
+
+    return await _single_flight(("year_table",) + cache_key,
+                                lambda: _load_year_table(section_opcao, year, subopcao_value, suboption_name))
+
+class YearRows(list):
+    """
+    Rows of one year table in site order, plus `key_index`: (row key, position) pairs sorted by row key,
+    built once when the table is cached so cursor pagination can resume by key without re-sorting.
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        super().__init__(rows)
+        self.key_index: List[Tuple[Tuple[str, str], int]] = sorted(
+            (row_key(row), position) for position, row in enumerate(self)
+        )
+
+def _store_year_table(cache_key: Tuple[str, Optional[str], int], rows: List[Dict[str, Any]],
+                      engine: str) -> List[Dict[str, Any]]:
+    """Records a freshly parsed year table in the change log and caches it, indexed for pagination."""
+    section_opcao, subopcao_value, year = cache_key
+    rows = YearRows(rows)
+    change_log.record_table(section_opcao, subopcao_value, year, rows, engine)
+    _cache_set(_year_data_cache, cache_key, rows)
+    return rows
+
+async def _request_year_table(section_opcao: str, year: int, subopcao_value: Optional[str],
+                              suboption_name: Optional[str]) -> List[Dict[str, Any]]:
+    """Requests and parses one year page, without touching the cache or the change log."""
+    params = {"opcao": section_opcao, "ano": year}
+    if subopcao_value:
+        params["subopcao"] = subopcao_value
+
+    soup = await _make_request("index.php", params=params)
+    return _parse_single_year_summary_table(soup, year, suboption_name, section_opcao_for_debug=section_opcao)
+
+async def _load_year_table(section_opcao: str, year: int, subopcao_value: Optional[str],
+                           suboption_name: Optional[str]) -> List[Dict[str, Any]]:
+    cache_key = (section_opcao, subopcao_value, year)
+    parsed_data = await _request_year_table(section_opcao, year, subopcao_value, suboption_name)
+    return _store_year_table(cache_key, parsed_data, ENGINE_HTML)
+
+def _format_csv_value(raw: str) -> Tuple[str, bool]:
+    """Formats a raw CSV number like the HTML tables do ('1234567' -> '1.234.567'). Returns (value, has_value)."""
+    raw = raw.strip()
+    if not raw or raw == "-":
+        return "0", False
+    try:
+        number = int(float(raw.replace(",", ".")))
+    except ValueError:
+        return raw, True
+    if number == 0:
+        return "0", False
+    return f"{number:,}".replace(",", "."), True
+
+async def _stream_csv_download(file_name: str) -> Optional[Dict[int, List[List[str]]]]:
+    """
+    Streams a bulk CSV download and splits it into per-year cells without holding the raw body in memory.
+    Returns {year: [[item, control, value, ...], ...]} or None when the download is unavailable.
+    """
+    full_url = _build_url(f"download/{file_name}")
+
+    async with httpx.AsyncClient(
+        headers={"User-Agent": settings.USER_AGENT or "Mozilla/5.0"},
+        timeout=settings.TIMEOUT,
+        follow_redirects=True
+    ) as client:
+        try:
+            print(f"Streaming CSV download: {full_url}")
+            async with _request_semaphore:
+                async with client.stream("GET", full_url) as response:
+                    if response.status_code != 200:
+                        print(f"CSV download unavailable ({response.status_code}) for {full_url}")
+                        return None
+
+                    rows_by_year: Dict[int, List[List[str]]] = {}
+                    header: Optional[List[str]] = None
+                    delimiter = ";"
+                    year_columns: Dict[int, List[int]] = {}
+                    item_col_idx = 0
+                    control_col_idx: Optional[int] = None
+
+                    async for line in response.aiter_lines():
+                        if not line.strip():
+                            continue
+                        if header is None:
+                            delimiter = "\t" if "\t" in line else ";"
+                            header = [h.strip().lstrip("\ufeff") for h in next(csv.reader([line], delimiter=delimiter))]
+                            # Sections with quantity and value repeat each year header twice.
+                            for i, h in enumerate(header):
+                                if re.fullmatch(r"\d{4}", h):
+                                    year_columns.setdefault(int(h), []).append(i)
+                            if not year_columns:
+                                print(f"Warning: No year columns found in CSV header of {file_name}.")
+                                return None
+                            item_col_idx = min(min(idxs) for idxs in year_columns.values()) - 1
+                            lowered = [h.lower() for h in header]
+                            if "control" in lowered:
+                                control_col_idx = lowered.index("control")
+                            continue
+
+                        cells = next(csv.reader([line], delimiter=delimiter))
+                        if len(cells) < len(header):
+                            continue
+                        item_name = ' '.join(cells[item_col_idx].split())
+                        control = cells[control_col_idx].strip() if control_col_idx is not None else ""
+                        for year, col_indices in year_columns.items():
+                            rows_by_year.setdefault(year, []).append(
+                                [item_name, control] + [cells[i] for i in col_indices]
+                            )
+                    return rows_by_year
+        except httpx.RequestError as exc:
+            print(f"Request error while streaming CSV {full_url}: {exc}")
+            return None
+
+def _normalize_csv_year_rows(raw_rows: List[List[str]], year: int, item_col_name: str,
+                             value_col_names: List[str],
+                             suboption_name: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Normalizes one year of CSV cells to the row schema of `_parse_single_year_summary_table`."""
+    extracted_data: List[Dict[str, Any]] = []
+    current_main_category = None
+
+    for item_name, control, *raw_values in raw_rows:
+        if not item_name or item_name.lower() == "total":
+            continue
+        # In the downloads, category rows carry a control code equal to the item (or none) and
+        # sub-items carry a prefixed code such as 'vm_Tinto'.
+        is_subitem = bool(control) and "_" in control
+        if not is_subitem:
+            current_main_category = item_name
+
+        data_item: Dict[str, Any] = {item_col_name: item_name}
+        data_item["Ano"] = year
+        if suboption_name:
+            data_item["Subopcao_Selecionada"] = suboption_name
+        if is_subitem and current_main_category and item_name != current_main_category:
+            data_item["Categoria_Principal"] = current_main_category
+
+        has_values = False
+        for i, value_col_name in enumerate(value_col_names):
+            value, present = _format_csv_value(raw_values[i]) if i < len(raw_values) else ("0", False)
+            data_item[value_col_name] = value
+            has_values = has_values or present
+
+        if has_values:
+            extracted_data.append(data_item)
+    return extracted_data
+
+def _rows_signature(rows: List[Dict[str, Any]]) -> List[Tuple[Any, ...]]:
+    return sorted(tuple(sorted((k, str(v)) for k, v in row.items())) for row in rows)
+
+async def check_engine_consistency(section_opcao: str, year: int,
+                                   subopcao_value: Optional[str] = None,
+                                   csv_rows: Optional[List[Dict[str, Any]]] = None,
+                                   suboption_name: Optional[str] = None) -> bool:
+    """Compares the CSV rows of one year against the HTML page of the same year and logs any mismatch."""
+    if csv_rows is None:
+        csv_tables = await _fetch_all_years_csv(section_opcao, subopcao_value, suboption_name, populate_cache=False)
+        if csv_tables is None:
+            return False
+        csv_rows = next((rows for table_year, rows in csv_tables if table_year == year), [])
+
+    # Straight from the site: the cache may already hold the CSV rows being checked.
+    html_rows = await _request_year_table(section_opcao, year, subopcao_value, suboption_name)
+    csv_signature = _rows_signature(csv_rows)
+    html_signature = _rows_signature(html_rows)
+    if csv_signature == html_signature:
+        return True
+
+    only_csv = [r for r in csv_signature if r not in html_signature]
+    only_html = [r for r in html_signature if r not in csv_signature]
+    print(f"Warning: CSV/HTML mismatch for {section_opcao}/{subopcao_value} year {year}: "
+          f"{len(only_csv)} rows only in CSV, {len(only_html)} rows only in HTML. "
+          f"First CSV-only: {only_csv[:1]}, first HTML-only: {only_html[:1]}")
+    return False
+
+async def _fetch_all_years_csv(section_opcao: str, subopcao_value: Optional[str],
+                               suboption_name: Optional[str],
+                               populate_cache: bool = True) -> Optional[List[Tuple[int, List[Dict[str, Any]]]]]:
+    """All-years ingestion from the bulk CSV download in one request. Returns None when unavailable."""
+    download = CSV_DOWNLOAD_MAP.get((section_opcao, subopcao_value))
+    if download is None:
+        return None
+    file_name, item_col_name, value_col_names = download
+
+    try:
+        rows_by_year = await _stream_csv_download(file_name)
+        if not rows_by_year:
+            return None
+        normalized = {
+            year: _normalize_csv_year_rows(rows_by_year[year], year, item_col_name, value_col_names, suboption_name)
+            for year in sorted(rows_by_year)
+        }
+    except (UnicodeDecodeError, csv.Error, IndexError, ValueError) as exc:
+        print(f"CSV download {file_name} is unusable: {exc}")
+        return None
+
+    tables: List[Tuple[int, List[Dict[str, Any]]]] = []
+    for year, year_data in normalized.items():
+        if populate_cache:
+            year_data = _store_year_table((section_opcao, subopcao_value, year), year_data, ENGINE_CSV)
+        tables.append((year, year_data))
+    return tables
+
+async def _fetch_all_years_html(section_opcao: str, subopcao_value: Optional[str],
+                                suboption_name: Optional[str]) -> Tuple[List[Tuple[int, List[Dict[str, Any]]]], List[int]]:
+    """Returns ((year, rows) of every fetched year, years left out because the request deadline ran out)."""
+    min_year, max_year = await get_year_range(section_opcao, subopcao_value)
+    if min_year is None or max_year is None:
+        raise ValueError(f"Could not determine year range for {section_opcao}/{subopcao_value} to fetch all years.")
+
+    tables: List[Tuple[int, List[Dict[str, Any]]]] = []
+    missing_years: List[int] = []
+    year_list_for_tasks = list(range(min_year, max_year + 1))
+    tasks = [
+        fetch_year_table(section_opcao, year, subopcao_value, suboption_name)
+        for year in year_list_for_tasks
+    ]
+
+    year_results = await gather(*tasks, return_exceptions=True)
+
+    for i, data_or_exc in enumerate(year_results):
+        year = year_list_for_tasks[i]
+        if isinstance(data_or_exc, DeadlineExceeded):
+            missing_years.append(year)
+            continue
+        if isinstance(data_or_exc, Exception):
+            print(f"Failed to fetch data for {section_opcao}/{subopcao_value} year {year}: {data_or_exc}")
+            continue
+        tables.append((year, data_or_exc))
+    return tables, missing_years
+
+def _cached_year_tables(section_opcao: str, subopcao_value: Optional[str],
+                        min_year: int, max_year: int) -> Optional[List[Tuple[int, List[Dict[str, Any]]]]]:
+    """Every year of the range from the cache, or None as soon as one year is missing or stale."""
+    tables: List[Tuple[int, List[Dict[str, Any]]]] = []
+    for year in range(min_year, max_year + 1):
+        rows = _cache_get(_year_data_cache, (section_opcao, subopcao_value, year), settings.SCRAPER_CACHE_TTL_SECONDS)
+        if rows is None:
+            return None
+        tables.append((year, rows))
+    return tables
+
+# Strong references to fire-and-forget tasks, so they are not garbage collected while running.
+_background_tasks: Set[Task] = set()
+
+def _run_in_background(coroutine: Awaitable[Any]) -> None:
+    task = ensure_future(coroutine)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+async def _check_engine_consistency_quietly(section_opcao: str, year: int, subopcao_value: Optional[str],
+                                            csv_rows: List[Dict[str, Any]], suboption_name: Optional[str]) -> None:
+    try:
+        await check_engine_consistency(section_opcao, year, subopcao_value,
+                                       csv_rows=csv_rows, suboption_name=suboption_name)
+    except Exception as exc:
+        print(f"Consistency check skipped for {section_opcao}/{subopcao_value}: {exc}")
+
+async def fetch_embrapa_tables(section_opcao: str,
+                               year_to_fetch: Optional[int] = None,
+                               all_years: bool = False,
+                               subopcao_value: Optional[str] = None,
+                               engine: Optional[str] = None,
+                               suboption_name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Same as `fetch_embrapa_data`, but returns {"tables": [(year, rows), ...]} in ascending year order.
+    The row lists are the cached ones, shared with other requests, and must not be modified.
+    """
     
-    suboption_name_for_data = None
-    if subopcao_value and section_opcao in [OPCAO_MAP["processamento"], OPCAO_MAP["importacao"], OPCAO_MAP["exportacao"]]:
+    suboption_name_for_data = suboption_name
+    if subopcao_value and suboption_name_for_data is None and section_opcao in SECTIONS_WITH_SUBOPTIONS:
         available_subs = await get_available_suboptions(section_opcao)
         for sub in available_subs:
             if sub['value'] == subopcao_value:
@@ -208,42 +599,52 @@ async def fetch_embrapa_data(section_opcao: str,
                 break
     
     if all_years:
-        min_year, max_year = await get_year_range(section_opcao, subopcao_value)
-        if min_year is None or max_year is None:
-            raise ValueError(f"Could not determine year range for {section_opcao}/{subopcao_value} to fetch all years.")
-        
-        aggregated_data: List[Dict[str, Any]] = []
-        tasks = []
-        year_list_for_tasks = list(range(min_year, max_year + 1))
-
-        for year in year_list_for_tasks:
-            params = {"opcao": section_opcao, "ano": year}
-            if subopcao_value:
-                params["subopcao"] = subopcao_value
-            
-            tasks.append(_make_request("index.php", params=params))
-        
-        page_soups = await gather(*tasks, return_exceptions=True)
-        
-        for i, soup_or_exc in enumerate(page_soups):
-            year = year_list_for_tasks[i]
-            if isinstance(soup_or_exc, Exception):
-                print(f"Failed to fetch page for {section_opcao}/{subopcao_value} year {year}: {soup_or_exc}")
-                continue
-            try:
-                year_data = _parse_single_year_summary_table(soup_or_exc, year, suboption_name_for_data, section_opcao_for_debug=section_opcao)
-                aggregated_data.extend(year_data)
-            except Exception as e:
-                print(f"Failed to parse data for {section_opcao}/{subopcao_value} year {year}: {e}")
-        return {"data": aggregated_data}
+        engine = engine or settings.SCRAPER_ENGINE
+        if engine == ENGINE_CSV:
+            # A previous download (or the HTML engine) may already have every year warm in the cache.
+            year_range = _cache_get(_year_range_cache, (section_opcao, subopcao_value), settings.SCRAPER_METADATA_TTL_SECONDS)
+            if year_range is not None and None not in year_range:
+                cached_tables = _cached_year_tables(section_opcao, subopcao_value, *year_range)
+                if cached_tables is not None:
+                    return {"tables": cached_tables}
+            csv_tables = await _single_flight(
+                ("csv", section_opcao, subopcao_value),
+                lambda: _fetch_all_years_csv(section_opcao, subopcao_value, suboption_name_for_data)
+            )
+            if csv_tables:
+                if settings.SCRAPER_CSV_CONSISTENCY_CHECK:
+                    # Off the request path: the check costs an extra HTML round trip.
+                    latest_year, latest_rows = csv_tables[-1]
+                    _run_in_background(_check_engine_consistency_quietly(
+                        section_opcao, latest_year, subopcao_value, latest_rows, suboption_name_for_data
+                    ))
+                return {"tables": csv_tables}
+            print(f"CSV download unavailable for {section_opcao}/{subopcao_value}, falling back to HTML engine.")
+        tables, missing_years = await _fetch_all_years_html(section_opcao, subopcao_value, suboption_name_for_data)
+        if missing_years:
+            print(f"Deadline exceeded for {section_opcao}/{subopcao_value}: returning partial data without years {missing_years}.")
+            return {"tables": tables, "partial": True, "missing_years": missing_years}
+        return {"tables": tables}
         
     elif year_to_fetch:
-        params = {"opcao": section_opcao, "ano": year_to_fetch}
-        if subopcao_value:
-            params["subopcao"] = subopcao_value
-        
-        soup = await _make_request("index.php", params=params)
-        parsed_data = _parse_single_year_summary_table(soup, year_to_fetch, suboption_name_for_data, section_opcao_for_debug=section_opcao)
-        return {"data": parsed_data}
+        parsed_data = await fetch_year_table(section_opcao, year_to_fetch, subopcao_value, suboption_name_for_data)
+        return {"tables": [(year_to_fetch, parsed_data)]}
     else:
-        raise ValueError("Year must be specified or all_years=True.")
\ No newline at end of file
+        raise ValueError("Year must be specified or all_years=True.")
+
+async def fetch_embrapa_data(section_opcao: str,
+                             year_to_fetch: Optional[int] = None,
+                             all_years: bool = False,
+                             subopcao_value: Optional[str] = None,
+                             engine: Optional[str] = None,
+                             suboption_name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Main data fetching and parsing orchestrator.
+    `engine` selects how all-years data is ingested ('html' or 'csv'); defaults to settings.SCRAPER_ENGINE.
+    `suboption_name` skips the suboption lookup when the caller already resolved it.
+    When the request deadline runs out during an all-years fetch, the years completed so far are
+    returned with `partial` set and the remaining years listed in `missing_years`.
+    """
+    result = await fetch_embrapa_tables(section_opcao, year_to_fetch, all_years, subopcao_value, engine, suboption_name)
+    tables = result.pop("tables")
+    return {"data": [row for _, rows in tables for row in rows], **result}
\ No newline at end of file
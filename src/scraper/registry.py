@@ -0,0 +1,101 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+@dataclass
+class SectionSpec:
+    """
+    Declarative description of one section of the Embrapa site. API routers, the refresh scheduler,
+    the batch planner and the CSV engine are all derived from these entries.
+    """
+    key: str
+    opcao: str
+    name_pt: str
+    has_suboptions: bool = False
+    suboption_kind_pt: str = ""
+    suboption_example_pt: str = ""
+    item_column: str = "Produto"
+    value_columns: Tuple[str, ...] = ("Quantidade (L.)",)
+    # Bulk CSV download per suboption value (None for sections without suboptions).
+    csv_downloads: Dict[Optional[str], str] = field(default_factory=dict)
+
+    @property
+    def prefix(self) -> str:
+        return f"/{self.key}"
+
+SECTIONS: List[SectionSpec] = [
+    SectionSpec(
+        key="producao",
+        opcao="opt_02",
+        name_pt="Produção",
+        csv_downloads={None: "Producao.csv"},
+    ),
+    SectionSpec(
+        key="processamento",
+        opcao="opt_03",
+        name_pt="Processamento",
+        has_suboptions=True,
+        suboption_kind_pt="categorias de processamento",
+        suboption_example_pt="Viníferas",
+        item_column="Cultivar",
+        value_columns=("Quantidade (Kg)",),
+        csv_downloads={
+            "subopt_01": "ProcessaViniferas.csv",
+            "subopt_02": "ProcessaAmericanas.csv",
+            "subopt_03": "ProcessaMesa.csv",
+            "subopt_04": "ProcessaSemclass.csv",
+        },
+    ),
+    SectionSpec(
+        key="comercializacao",
+        opcao="opt_04",
+        name_pt="Comercialização",
+        csv_downloads={None: "Comercio.csv"},
+    ),
+    SectionSpec(
+        key="importacao",
+        opcao="opt_05",
+        name_pt="Importação",
+        has_suboptions=True,
+        suboption_kind_pt="categorias de importação",
+        suboption_example_pt="Vinhos de mesa",
+        item_column="Países",
+        value_columns=("Quantidade (Kg)", "Valor (US$)"),
+        csv_downloads={
+            "subopt_01": "ImpVinhos.csv",
+            "subopt_02": "ImpEspumantes.csv",
+            "subopt_03": "ImpFrescas.csv",
+            "subopt_04": "ImpPassas.csv",
+            "subopt_05": "ImpSuco.csv",
+        },
+    ),
+    SectionSpec(
+        key="exportacao",
+        opcao="opt_06",
+        name_pt="Exportação",
+        has_suboptions=True,
+        suboption_kind_pt="categorias de exportação",
+        suboption_example_pt="Vinhos de mesa",
+        item_column="Países",
+        value_columns=("Quantidade (Kg)", "Valor (US$)"),
+        csv_downloads={
+            "subopt_01": "ExpVinho.csv",
+            "subopt_02": "ExpEspumantes.csv",
+            "subopt_03": "ExpUva.csv",
+            "subopt_04": "ExpSuco.csv",
+        },
+    ),
+]
+
+SECTION_REGISTRY: Dict[str, SectionSpec] = {spec.key: spec for spec in SECTIONS}
+SECTIONS_BY_OPCAO: Dict[str, SectionSpec] = {spec.opcao: spec for spec in SECTIONS}
+
+OPCAO_MAP: Dict[str, str] = {spec.key: spec.opcao for spec in SECTIONS}
+
+SECTIONS_WITH_SUBOPTIONS: List[str] = [spec.opcao for spec in SECTIONS if spec.has_suboptions]
+
+# (file name, item column header, value column headers) per (section, suboption), matching the HTML table of the same page.
+CSV_DOWNLOAD_MAP: Dict[Tuple[str, Optional[str]], Tuple[str, str, List[str]]] = {
+    (spec.opcao, subopcao_value): (file_name, spec.item_column, list(spec.value_columns))
+    for spec in SECTIONS
+    for subopcao_value, file_name in spec.csv_downloads.items()
+}
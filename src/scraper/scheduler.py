@@ -0,0 +1,102 @@
+import asyncio
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+from ..config import settings
+from .core import (
+    fetch_year_table,
+    get_available_suboptions,
+    get_year_range,
+)
+from .registry import SECTIONS
+
+class RefreshScheduler:
+    """
+    Keeps the most recent years of every section/suboption warm in the scraper cache.
+    Requests go through `_make_request`, so they share the global SCRAPER_MAX_CONCURRENCY budget.
+    """
+
+    def __init__(self,
+                 interval_seconds: int = settings.SCRAPER_REFRESH_INTERVAL_SECONDS,
+                 jitter_seconds: int = settings.SCRAPER_REFRESH_JITTER_SECONDS,
+                 metadata_interval_seconds: int = settings.SCRAPER_METADATA_REFRESH_INTERVAL_SECONDS):
+        self.interval_seconds = interval_seconds
+        self.jitter_seconds = jitter_seconds
+        self.metadata_interval_seconds = metadata_interval_seconds
+        self._task: Optional[asyncio.Task] = None
+        # Discovered (section, suboption value, suboption name) targets, keyed by section opcao.
+        self._targets: Dict[str, List[Tuple[str, Optional[str], Optional[str]]]] = {}
+        self._last_discovery: Optional[float] = None
+
+    def start(self, initial_delay_seconds: float = 0) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(initial_delay_seconds))
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self, initial_delay_seconds: float) -> None:
+        if initial_delay_seconds:
+            await asyncio.sleep(initial_delay_seconds)
+        while True:
+            try:
+                await self.refresh_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                print(f"Refresh scheduler cycle failed: {exc}")
+            await asyncio.sleep(self.interval_seconds + random.uniform(0, self.jitter_seconds))
+
+    async def refresh_once(self) -> None:
+        now = time.monotonic()
+        rediscover = self._last_discovery is None or now - self._last_discovery >= self.metadata_interval_seconds
+        if rediscover:
+            await self._discover_targets()
+            self._last_discovery = now
+
+        await asyncio.gather(
+            *(self._refresh_target(section, sub_value, sub_name)
+              for targets in self._targets.values()
+              for section, sub_value, sub_name in targets),
+            return_exceptions=True
+        )
+
+    async def _discover_targets(self) -> None:
+        for spec in SECTIONS:
+            if not spec.has_suboptions:
+                self._targets[spec.opcao] = [(spec.opcao, None, None)]
+                continue
+            # A failing section page keeps its previous targets and does not stop the other sections.
+            try:
+                suboptions = await get_available_suboptions(spec.opcao, force_refresh=True)
+            except Exception as exc:
+                print(f"Refresh scheduler failed to discover suboptions for {spec.opcao}: {exc}")
+                continue
+            if suboptions:
+                self._targets[spec.opcao] = [(spec.opcao, sub["value"], sub["name"]) for sub in suboptions]
+        target_count = sum(len(targets) for targets in self._targets.values())
+        print(f"Refresh scheduler discovered {target_count} section/suboption targets.")
+
+    async def _refresh_target(self, section_opcao: str, subopcao_value: Optional[str],
+                              suboption_name: Optional[str]) -> None:
+        # Spread the start of each target across the jitter window to avoid bursts against the site.
+        await asyncio.sleep(random.uniform(0, self.jitter_seconds))
+        try:
+            # One page per target and cycle keeps the year range warm well within SCRAPER_METADATA_TTL_SECONDS.
+            _, max_year = await get_year_range(section_opcao, subopcao_value, force_refresh=True)
+            if max_year is None:
+                return
+            for year in (max_year, max_year - 1):
+                await fetch_year_table(section_opcao, year, subopcao_value, suboption_name, force_refresh=True)
+        except Exception as exc:
+            print(f"Refresh failed for {section_opcao}/{subopcao_value}: {exc}")
+
+refresh_scheduler = RefreshScheduler()
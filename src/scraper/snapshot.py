@@ -0,0 +1,187 @@
+"""
+Warm-start snapshots of the scraper caches.
+
+File layout: 8-byte magic, then the offset and length of the index (two big-endian uint64), then one
+zlib-compressed JSON blob per year table, then the zlib-compressed JSON index. The index holds the catalog
+metadata (suboptions and year ranges) and the position of every table blob, so a worker only maps the file
+at startup and decodes each table the first time it is requested; later requests go through the
+regular cache and scrape the page again once the entry expires.
+
+Usage:
+    python -m src.scraper.snapshot export snapshot.bin [--engine csv]
+    python -m src.scraper.snapshot inspect snapshot.bin
+"""
+import argparse
+import asyncio
+import json
+import mmap
+import os
+import struct
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config import settings
+from . import core
+from .registry import SECTIONS
+
+SNAPSHOT_MAGIC = b"EMBSNAP1"
+_HEADER = struct.Struct(">QQ")
+_HEADER_SIZE = len(SNAPSHOT_MAGIC) + _HEADER.size
+
+TableKey = Tuple[str, Optional[str], int]
+
+def _encode(value: Any) -> bytes:
+    return zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+def _decode(data: bytes) -> Any:
+    return json.loads(zlib.decompress(data).decode("utf-8"))
+
+def export_snapshot(path: str, engine: str = core.ENGINE_HTML) -> Dict[str, int]:
+    """Writes the current suboption, year-range and year-table caches, scraped with `engine`, to `path` atomically."""
+    index: Dict[str, Any] = {
+        "created_at": time.time(),
+        "engine": engine,
+        "suboptions": {opcao: value for opcao, (_, value) in core._suboptions_cache.items()},
+        "year_ranges": [[opcao, sub, min_year, max_year]
+                        for (opcao, sub), (_, (min_year, max_year)) in core._year_range_cache.items()],
+        "tables": [],
+    }
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(b"\0" * _HEADER_SIZE)
+        for (opcao, sub, year), (_, rows) in sorted(core._year_data_cache.items(), key=lambda item: str(item[0])):
+            blob = _encode(rows)
+            index["tables"].append([opcao, sub, year, f.tell(), len(blob)])
+            f.write(blob)
+        index_blob = _encode(index)
+        index_offset = f.tell()
+        f.write(index_blob)
+        f.seek(0)
+        f.write(SNAPSHOT_MAGIC + _HEADER.pack(index_offset, len(index_blob)))
+    os.replace(tmp_path, path)
+    return {"tables": len(index["tables"]), "bytes": os.path.getsize(path)}
+
+class SnapshotReader:
+    """Memory-mapped, read-only view of a snapshot file; table blobs are decoded on demand, once each."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Snapshot file {path} is empty.")
+        if self._map[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a snapshot file.")
+        index_offset, index_length = _HEADER.unpack_from(self._map, len(SNAPSHOT_MAGIC))
+        index = _decode(self._map[index_offset:index_offset + index_length])
+
+        self.created_at: float = index["created_at"]
+        self.engine: str = index.get("engine", core.ENGINE_HTML)
+        self.suboptions: Dict[str, List[Dict[str, str]]] = index["suboptions"]
+        self.year_ranges: Dict[Tuple[str, Optional[str]], Tuple[int, int]] = {
+            (opcao, sub): (min_year, max_year) for opcao, sub, min_year, max_year in index["year_ranges"]
+        }
+        self._tables: Dict[TableKey, Tuple[int, int]] = {
+            (opcao, sub, year): (offset, length) for opcao, sub, year, offset, length in index["tables"]
+        }
+
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - self.created_at
+
+    @property
+    def table_count(self) -> int:
+        return len(self._tables)
+
+    def take_table(self, key: TableKey) -> Optional[List[Dict[str, Any]]]:
+        """Decodes a table and drops it from the index, so later calls for the same key return None."""
+        position = self._tables.pop(key, None)
+        if position is None:
+            return None
+        offset, length = position
+        return _decode(self._map[offset:offset + length])
+
+    def close(self) -> None:
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+        self._file.close()
+
+def load_snapshot(path: str) -> Optional[SnapshotReader]:
+    """
+    Startup hook: maps the snapshot, seeds the metadata caches and lets `fetch_year_table` decode tables lazily.
+    Returns None when the file is missing, unreadable or older than SNAPSHOT_MAX_AGE_SECONDS.
+    """
+    if not os.path.exists(path):
+        print(f"Snapshot {path} not found, starting cold.")
+        return None
+    try:
+        reader = SnapshotReader(path)
+    except Exception as exc:
+        print(f"Failed to open snapshot {path}, starting cold: {exc}")
+        return None
+    if reader.age_seconds > settings.SNAPSHOT_MAX_AGE_SECONDS:
+        print(f"Snapshot {path} is {int(reader.age_seconds)}s old, ignoring it.")
+        reader.close()
+        return None
+
+    # Loaded entries count as fresh from now on; SNAPSHOT_MAX_AGE_SECONDS is what bounds their staleness.
+    for opcao, suboptions in reader.suboptions.items():
+        core._cache_set(core._suboptions_cache, opcao, suboptions)
+    for key, year_range in reader.year_ranges.items():
+        core._cache_set(core._year_range_cache, key, year_range)
+    core.attach_snapshot(reader)
+    print(f"Loaded snapshot {path}: {reader.table_count} tables, {int(reader.age_seconds)}s old.")
+    return reader
+
+def unload_snapshot(reader: Optional[SnapshotReader]) -> None:
+    if reader is None:
+        return
+    core.attach_snapshot(None)
+    reader.close()
+
+async def _scrape_everything(engine: Optional[str]) -> None:
+    for spec in SECTIONS:
+        if spec.has_suboptions:
+            suboptions = await core.get_available_suboptions(spec.opcao)
+            targets = [(sub["value"], sub["name"]) for sub in suboptions]
+        else:
+            targets = [(None, None)]
+        for subopcao_value, suboption_name in targets:
+            try:
+                result = await core.fetch_embrapa_data(spec.opcao, all_years=True, subopcao_value=subopcao_value,
+                                                       engine=engine, suboption_name=suboption_name)
+                print(f"Scraped {spec.key}/{subopcao_value}: {len(result['data'])} rows")
+            except Exception as exc:
+                print(f"Failed to scrape {spec.key}/{subopcao_value}: {exc}")
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Export or inspect scraper warm-start snapshots.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    export_parser = subparsers.add_parser("export", help="Scrape every section and write a snapshot file.")
+    export_parser.add_argument("path")
+    export_parser.add_argument("--engine", choices=[core.ENGINE_HTML, core.ENGINE_CSV], default=None)
+    inspect_parser = subparsers.add_parser("inspect", help="Print the contents summary of a snapshot file.")
+    inspect_parser.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        engine = args.engine or settings.SCRAPER_ENGINE
+        asyncio.run(_scrape_everything(engine))
+        summary = export_snapshot(args.path, engine)
+        print(f"Wrote snapshot {args.path}: {summary['tables']} tables, {summary['bytes']} bytes.")
+    else:
+        reader = SnapshotReader(args.path)
+        try:
+            print(f"Snapshot {args.path}: {reader.table_count} tables, "
+                  f"{len(reader.suboptions)} suboption lists, {len(reader.year_ranges)} year ranges, "
+                  f"{int(reader.age_seconds)}s old.")
+        finally:
+            reader.close()
+
+if __name__ == "__main__":
+    main()